@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+import itertools
 import logging
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
-from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.entity_component import DATA_INSTANCES, EntityComponent
 import homeassistant.util.ulid as ulid_util
 
 from .const import (
@@ -24,227 +26,240 @@ from .const import (
     DEFAULT_MIN_PERSIST_DURATION,
     DOMAIN,
     SERVICE_CANCEL,
+    SERVICE_CREATE_MANY,
     SERVICE_CREATE_TEMPORARY,
     SERVICE_DELETE,
     SERVICE_FINISH,
+    SERVICE_METHOD_MAP,
     SERVICE_PAUSE,
     SERVICE_RESUME,
     SERVICE_START,
 )
+from .entity import TemporaryEntity
 from .manager import TemporaryEntityManager
+from .timer import TemporaryTimer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Short-lived timers still land in the entity registry, so their counter ids
+# carry a per-process prefix (the ULID timestamp part) to stay unique across
+# restarts
+_SESSION_ID = ulid_util.ulid_now()[:10].lower()
+_SESSION_COUNTER = itertools.count()
+
+# Entity services only accept entity_ids the manager knows about, so the
+# manager lookup doubles as validation and the entity_id regex is skipped;
+# lowercasing keeps cv.entity_id's normalization
+_ENTITY_ID = vol.All(cv.string, vol.Lower)
+_ENTITY_ID_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): _ENTITY_ID})
+
+_CREATE_TIMER_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        vol.Required("duration"): cv.positive_int,
+    }
+)
 
-def _register_services(  # noqa: C901
-    hass: HomeAssistant,
-    manager: TemporaryEntityManager,
-) -> None:
-    """Register integration services."""
-
-    async def handle_create_temporary(call: ServiceCall) -> None:
-        """Handle create temporary timer service call."""
-        name = call.data["name"]
-        duration = call.data["duration"]  # seconds
-
-        # Import here to avoid circular dependency at module level
-        from .timer import TemporaryTimer  # noqa: PLC0415
-
-        # Create unique ID based on timestamp
-        unique_id = f"timer_{ulid_util.ulid_now().lower()}"
-
-        # Get the entity component
-        component = hass.data[DOMAIN].get("component")
-
-        if not component:
-            _LOGGER.error("Entity component not set up, cannot create timer")
-            return
-
-        # Get the config entry ID
-        config_entry_id = hass.data[DOMAIN].get("config_entry_id")
-
-        # Create timer entity
-        timer = TemporaryTimer(
-            hass,
+# Built once per process and reused across config entry reloads
+_SERVICE_SCHEMAS: dict[str, vol.Schema] = {
+    SERVICE_CREATE_TEMPORARY: _CREATE_TIMER_SCHEMA,
+    SERVICE_CREATE_MANY: vol.Schema(
+        {vol.Required("timers"): vol.All(cv.ensure_list, [_CREATE_TIMER_SCHEMA])}
+    ),
+    SERVICE_START: _ENTITY_ID_SCHEMA.extend(
+        {vol.Optional("duration", default=None): vol.Any(None, cv.positive_int)}
+    ),
+    SERVICE_CANCEL: _ENTITY_ID_SCHEMA,
+    SERVICE_FINISH: _ENTITY_ID_SCHEMA,
+    SERVICE_DELETE: vol.Schema(
+        {vol.Required(ATTR_ENTITY_ID): vol.All(cv.ensure_list_csv, [_ENTITY_ID])}
+    ),
+    SERVICE_PAUSE: _ENTITY_ID_SCHEMA,
+    SERVICE_RESUME: _ENTITY_ID_SCHEMA,
+}
+
+
+@callback
+def _resolve(
+    manager: TemporaryEntityManager, entity_id: str, service: str
+) -> tuple[TemporaryEntity, Callable[[], None]] | None:
+    """Return an entity and the bound method backing an action service."""
+    entity = manager.get_entity(entity_id)
+    if not entity:
+        _LOGGER.error("Entity %s not found", entity_id)
+        return None
+
+    if not manager.supports(entity, service):
+        _LOGGER.error("Entity %s does not support %s", entity_id, service)
+        return None
+
+    return entity, getattr(entity, SERVICE_METHOD_MAP[service])
+
+
+class _ServiceDispatcher:
+    """Service handlers for one config entry, bound once at setup."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        manager: TemporaryEntityManager,
+        component: EntityComponent[TemporaryEntity],
+        config_entry_id: str,
+    ) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self.manager = manager
+        self.component = component
+        self.config_entry_id = config_entry_id
+
+    def _build_timer(self, name: str, duration: int) -> TemporaryTimer:
+        """Build a timer entity with a fresh unique ID."""
+        # Persistable timers get a ULID; short-lived ones only need to be
+        # unique within this run, so a counter is enough
+        if duration >= self.manager.min_persist_duration.total_seconds():
+            unique_id = f"timer_{ulid_util.ulid_now().lower()}"
+        else:
+            unique_id = f"timer_tmp_{_SESSION_ID}_{next(_SESSION_COUNTER)}"
+
+        return TemporaryTimer(
+            self.hass,
             unique_id=unique_id,
             name=name,
             duration=duration,
-            config_entry_id=config_entry_id,
+            config_entry_id=self.config_entry_id,
         )
 
+    async def async_create_temporary(self, call: ServiceCall) -> None:
+        """Handle create temporary timer service call."""
+        timer = self._build_timer(call.data["name"], call.data["duration"])
+
         # Add entity through the entity component
-        await component.async_add_entities([timer])
+        await self.component.async_add_entities([timer])
 
         # Start the timer
-        await timer.start()
+        timer.start()
         _LOGGER.info("Created and started temporary timer: %s", timer.entity_id)
 
-    async def handle_start(call: ServiceCall) -> None:
-        """Handle start timer service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        duration = call.data.get("duration")
-
-        try:
-            entity = manager.get_entity(entity_id)
-            if not entity:
-                _LOGGER.error("Timer %s not found", entity_id)
-                return
+    async def async_create_many(self, call: ServiceCall) -> None:
+        """Handle create many timers service call.
+
+        All timers are added in a single async_add_entities call, so the
+        per-call platform overhead is paid once per batch.
+        """
+        timers = [
+            self._build_timer(spec["name"], spec["duration"])
+            for spec in call.data["timers"]
+        ]
+        if not timers:
+            return
 
-            # Check if entity has start method (timer specific)
-            if not hasattr(entity, "start"):
-                _LOGGER.error("Entity %s does not support start", entity_id)
-                return
+        await self.component.async_add_entities(timers)
 
-            # Set new duration if provided
-            if duration and hasattr(entity, "set_duration"):
-                entity.set_duration(duration)  # type: ignore[attr-defined]
+        for timer in timers:
+            timer.start()
+        _LOGGER.info("Created and started %d temporary timers", len(timers))
 
-            await entity.start()  # type: ignore[attr-defined]
-        except (KeyError, ValueError, AttributeError) as err:
-            _LOGGER.error("Error starting entity %s: %s", entity_id, err)
+    @callback
+    def async_action(self, call: ServiceCall) -> None:
+        """Handle an entity action service call (start, pause, resume, ...).
 
-    async def handle_cancel(call: ServiceCall) -> None:
-        """Handle cancel timer service call."""
+        Every action method is a callback, so it runs inline.
+        """
+        service = call.service
         entity_id = call.data[ATTR_ENTITY_ID]
 
-        try:
-            entity = manager.get_entity(entity_id)
-            if not entity:
-                _LOGGER.error("Timer %s not found", entity_id)
-                return
-
-            # Check if entity has cancel method (timer specific)
-            if not hasattr(entity, "async_cancel"):
-                _LOGGER.error("Entity %s does not support cancel", entity_id)
-                return
-
-            entity.async_cancel()  # type: ignore[attr-defined]
-        except (KeyError, ValueError, AttributeError) as err:
-            _LOGGER.error("Error canceling entity %s: %s", entity_id, err)
-
-    async def handle_finish(call: ServiceCall) -> None:
-        """Handle finish timer service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
+        if (resolved := _resolve(self.manager, entity_id, service)) is None:
+            return
+        entity, method = resolved
 
         try:
-            entity = manager.get_entity(entity_id)
-            if not entity:
-                _LOGGER.error("Timer %s not found", entity_id)
-                return
+            # Set new duration if provided (timer specific; None is a no-op)
+            if service == SERVICE_START:
+                entity.set_duration(call.data["duration"])  # type: ignore[attr-defined]
 
-            # Check if entity has finish method (timer specific)
-            if not hasattr(entity, "async_finish"):
-                _LOGGER.error("Entity %s does not support finish", entity_id)
-                return
-
-            entity.async_finish()  # type: ignore[attr-defined]
+            method()
         except (KeyError, ValueError, AttributeError) as err:
-            _LOGGER.error("Error finishing entity %s: %s", entity_id, err)
+            _LOGGER.error("Error running %s on entity %s: %s", service, entity_id, err)
 
-    async def handle_delete(call: ServiceCall) -> None:
+    async def async_delete(self, call: ServiceCall) -> None:
         """Handle delete service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        try:
-            await manager.async_remove_entity(entity_id)
-        except (KeyError, ValueError) as err:
-            _LOGGER.error("Error deleting entity %s: %s", entity_id, err)
-
-    async def handle_pause(call: ServiceCall) -> None:
-        """Handle pause service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        try:
-            entity = manager.get_entity(entity_id)
-            if not entity:
-                _LOGGER.error("Entity %s not found", entity_id)
-                return
-            if not hasattr(entity, "async_pause"):
-                _LOGGER.error("Entity %s does not support pause", entity_id)
-                return
-            entity.async_pause()  # type: ignore[attr-defined]
-        except (KeyError, ValueError, AttributeError) as err:
-            _LOGGER.error("Error pausing entity %s: %s", entity_id, err)
-
-    async def handle_resume(call: ServiceCall) -> None:
-        """Handle resume service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        try:
-            entity = manager.get_entity(entity_id)
-            if not entity:
-                _LOGGER.error("Entity %s not found", entity_id)
-                return
-            if not hasattr(entity, "async_resume"):
-                _LOGGER.error("Entity %s does not support resume", entity_id)
-                return
-            await entity.async_resume()  # type: ignore[attr-defined]
-        except (KeyError, ValueError, AttributeError) as err:
-            _LOGGER.error("Error resuming entity %s: %s", entity_id, err)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_TEMPORARY,
-        handle_create_temporary,
-        schema=vol.Schema(
-            {
-                vol.Required("name"): cv.string,
-                vol.Required("duration"): cv.positive_int,
-            }
-        ),
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_START,
-        handle_start,
-        schema=vol.Schema(
-            {
-                vol.Required(ATTR_ENTITY_ID): cv.entity_id,
-                vol.Optional("duration"): cv.positive_int,
-            }
-        ),
-    )
+        # Per-entity failures are logged by the manager
+        await self.manager.async_remove_entities(call.data[ATTR_ENTITY_ID])
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CANCEL,
-        handle_cancel,
-        schema=vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id}),
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_FINISH,
-        handle_finish,
-        schema=vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id}),
-    )
+def _register_services(
+    hass: HomeAssistant,
+    manager: TemporaryEntityManager,
+    component: EntityComponent[TemporaryEntity],
+    config_entry_id: str,
+) -> None:
+    """Register integration services."""
+    dispatcher = _ServiceDispatcher(hass, manager, component, config_entry_id)
+    handlers = {
+        SERVICE_CREATE_TEMPORARY: dispatcher.async_create_temporary,
+        SERVICE_CREATE_MANY: dispatcher.async_create_many,
+        SERVICE_DELETE: dispatcher.async_delete,
+        **dict.fromkeys(SERVICE_METHOD_MAP, dispatcher.async_action),
+    }
+    for service, schema in _SERVICE_SCHEMAS.items():
+        hass.services.async_register(DOMAIN, service, handlers[service], schema=schema)
+
+
+@callback
+def _get_or_create_component(hass: HomeAssistant) -> EntityComponent[TemporaryEntity]:
+    """Return the temporary domain's entity component, creating it once.
+
+    EntityComponent indexes itself in hass.data by domain, so a config entry
+    reload reuses the existing component instead of building a new one.
+    """
+    component: EntityComponent[TemporaryEntity] | None = hass.data.get(
+        DATA_INSTANCES, {}
+    ).get(DOMAIN)
+    if component is None:
+        component = EntityComponent[TemporaryEntity](_LOGGER, DOMAIN, hass)
+    return component
+
+
+@callback
+def _restore_timer_entities(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> list[TemporaryTimer]:
+    """Build timer entities for every timer left in the entity registry.
+
+    Query by domain since EntityComponent entities are not associated with
+    a config entry in the registry, so the registry's config entry index
+    cannot find them. We own the 'temporary' domain, so all entities in it
+    belong to this integration.
+    """
+    ent_reg = er.async_get(hass)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE,
-        handle_delete,
-        schema=vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id}),
-    )
+    # Read-only pass, so iterate the registry in place instead of copying it
+    timers: list[TemporaryTimer] = []
+    for ent_entry in ent_reg.entities.values():
+        # Route to appropriate entity class based on unique_id prefix
+        if ent_entry.domain != DOMAIN or not ent_entry.unique_id.startswith("timer_"):
+            continue
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_PAUSE,
-        handle_pause,
-        schema=vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id}),
-    )
+        timers.append(
+            TemporaryTimer(
+                hass,
+                unique_id=ent_entry.unique_id,
+                name=ent_entry.original_name or ent_entry.entity_id.split(".")[-1],
+                duration=60,  # Default, will be restored from state
+                config_entry_id=entry.entry_id,
+            )
+        )
+        _LOGGER.debug("Restoring timer entity: %s", ent_entry.entity_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESUME,
-        handle_resume,
-        schema=vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_id}),
-    )
+    return timers
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up temporary entities from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create entity component for the temporary domain
-    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    # Get (or create) the entity component for the temporary domain
+    component = _get_or_create_component(hass)
     hass.data[DOMAIN]["component"] = component
 
     # Create manager with options from config entry
@@ -270,32 +285,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await manager.async_start()
 
     # Restore existing entities from entity registry
-    # Import here to avoid circular dependency at module level
-    from .timer import TemporaryTimer  # noqa: PLC0415
-
-    ent_reg = er.async_get(hass)
-
-    # Query by domain since EntityComponent entities may not be associated
-    # with a config entry in the registry. We own the 'temporary' domain,
-    # so all entities in it belong to this integration.
-    entities_to_restore: list[TemporaryTimer] = []
-    for ent_entry in list(ent_reg.entities.values()):
-        if ent_entry.domain != DOMAIN:
-            continue
-
-        # Route to appropriate entity class based on unique_id prefix
-        if ent_entry.unique_id and ent_entry.unique_id.startswith("timer_"):
-            name = ent_entry.original_name or ent_entry.entity_id.split(".")[-1]
-
-            timer = TemporaryTimer(
-                hass,
-                unique_id=ent_entry.unique_id,
-                name=name,
-                duration=60,  # Default, will be restored from state
-                config_entry_id=entry.entry_id,
-            )
-            entities_to_restore.append(timer)
-            _LOGGER.debug("Restoring timer entity: %s", ent_entry.entity_id)
+    entities_to_restore = _restore_timer_entities(hass, entry)
 
     # Add restored entities to the component
     if entities_to_restore:
@@ -307,7 +297,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Temporary Entities setup complete with options: %s", entry)
 
     # Register domain services
-    _register_services(hass, manager)
+    _register_services(hass, manager, component, entry.entry_id)
 
     return True
 
@@ -324,13 +314,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN].pop("component", None)
 
     # Unregister services
-    hass.services.async_remove(DOMAIN, SERVICE_CREATE_TEMPORARY)
-    hass.services.async_remove(DOMAIN, SERVICE_START)
-    hass.services.async_remove(DOMAIN, SERVICE_CANCEL)
-    hass.services.async_remove(DOMAIN, SERVICE_FINISH)
-    hass.services.async_remove(DOMAIN, SERVICE_DELETE)
-    hass.services.async_remove(DOMAIN, SERVICE_PAUSE)
-    hass.services.async_remove(DOMAIN, SERVICE_RESUME)
+    for service in _SERVICE_SCHEMAS:
+        hass.services.async_remove(DOMAIN, service)
 
     return True
 
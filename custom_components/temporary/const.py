@@ -6,9 +6,6 @@ DOMAIN = "temporary"
 # Version
 VERSION = "0.1.0"
 
-# Platforms
-PLATFORMS = []
-
 # Configuration keys
 CONF_MIN_PERSIST_DURATION = "min_persist_duration"
 CONF_CLEANUP_INTERVAL = "cleanup_interval"
@@ -20,7 +17,7 @@ DEFAULT_MIN_PERSIST_DURATION = (
     60  # seconds - entities shorter than this won't be saved to disk
 )
 DEFAULT_CLEANUP_INTERVAL = (
-    300  # seconds (5 minutes) - how often to check for expired entities
+    300  # seconds (5 minutes) - horizon of the cleanup timing wheel
 )
 DEFAULT_FINALIZED_GRACE_PERIOD = (
     30  # seconds - how long to keep finalized entities before cleanup
@@ -49,6 +46,16 @@ SERVICE_DELETE = "delete"
 SERVICE_PAUSE = "pause"
 SERVICE_RESUME = "resume"
 SERVICE_CREATE_TEMPORARY = "create_temporary"
+SERVICE_CREATE_MANY = "create_many"
 SERVICE_START = "start"
 SERVICE_CANCEL = "cancel"
 SERVICE_FINISH = "finish"
+
+# Entity method backing each entity action service
+SERVICE_METHOD_MAP = {
+    SERVICE_START: "start",
+    SERVICE_CANCEL: "async_cancel",
+    SERVICE_FINISH: "async_finish",
+    SERVICE_PAUSE: "async_pause",
+    SERVICE_RESUME: "async_resume",
+}
@@ -0,0 +1,25 @@
+"""Date and time helpers shared by temporary entities."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+
+import homeassistant.util.dt as dt_util
+
+# Bound once to skip the module attribute lookup on create, start and finalize
+utcnow = dt_util.utcnow
+
+
+@lru_cache(maxsize=1024)
+def parse_iso(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp, memoized across restores and reloads.
+
+    Our own attributes are written with ``isoformat()``, which
+    ``datetime.fromisoformat`` reads directly; anything else falls back to
+    the more lenient regex parser.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dt_util.parse_datetime(value)
@@ -2,36 +2,69 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import StateType
-import homeassistant.util.dt as dt_util
 
 from .const import (
     ATTR_CREATED_AT,
     ATTR_EXPECTED_DURATION,
     ATTR_FINALIZED_AT,
+    ATTR_STATE,
     DOMAIN,
     STATE_ACTIVE,
     STATE_FINALIZED,
     STATE_IDLE,
     STATE_PAUSED,
 )
+from .dt import parse_iso, utcnow
 
 if TYPE_CHECKING:
     from .manager import TemporaryEntityManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps HA-visible states back to internal lifecycle states on restore
+_RESTORE_STATE_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        STATE_IDLE: STATE_FINALIZED,
+        STATE_ACTIVE: STATE_ACTIVE,
+        STATE_PAUSED: STATE_PAUSED,
+    }
+)
+
+# Maps internal lifecycle states to HA-visible states where they differ
+_PRESENTED_STATE_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {STATE_FINALIZED: STATE_IDLE}
+)
+
 
 class TemporaryEntity(RestoreEntity, Entity):
     """Base class for temporary entities."""
 
+    # Entity keeps a __dict__ for its cached _attr_* properties, so only the
+    # lifecycle fields owned here are slotted (never _attr_* names, which
+    # would shadow the parent's property descriptors).
+    __slots__ = (
+        "_attrs_template",
+        "_created_at_iso",
+        "_created_at_ts",
+        "_expected_duration",
+        "_finalized_at_iso",
+        "_finalized_at_ts",
+        "_manager",
+        "_pending_state_write",
+        "_should_persist",
+        "_state",
+    )
+
     _attr_should_poll = False
 
     def _set_internal_state(self, state: str) -> None:
@@ -41,10 +74,8 @@ class TemporaryEntity(RestoreEntity, Entity):
         since finalized is an internal lifecycle concept.
         """
         self._state = state
-        if state == STATE_FINALIZED:
-            self._attr_state = STATE_IDLE
-        else:
-            self._attr_state = state
+        self._attrs_template[ATTR_STATE] = state
+        self._attr_state = _PRESENTED_STATE_MAP.get(state, state)
 
     def __init__(
         self,
@@ -62,42 +93,63 @@ class TemporaryEntity(RestoreEntity, Entity):
         if config_entry_id:
             self._attr_config_entry_id = config_entry_id
 
-        # Temporary entity metadata
-        self._created_at: datetime = dt_util.utcnow()
-        self._finalized_at: datetime | None = None
+        # Resolved once; restore can finalize the entity before it registers
+        self._manager: TemporaryEntityManager = hass.data[DOMAIN]["manager"]
+
+        # Temporary entity metadata; Unix timestamps for cheap cleanup
+        # comparisons, with ISO strings for attributes below
+        created_at = utcnow()
+        self._created_at_ts = created_at.timestamp()
+        self._finalized_at_ts: float | None = None
         self._expected_duration = (
             timedelta(seconds=expected_duration)
             if expected_duration is not None
             else None
         )
+        # Duration and min_persist_duration only change on restore, so the
+        # persistence decision is computed up front rather than per access
+        self._should_persist: bool
+        self._update_should_persist()
         self._state: str = STATE_ACTIVE
         self._attr_state: StateType = STATE_ACTIVE
 
-    def _update_extra_state_attributes(self) -> None:
-        """Update entity specific state attributes."""
-        attrs: dict[str, Any] = {
-            ATTR_CREATED_AT: self._created_at.isoformat(),
+        # Timestamps only change on restore or finalize, so their ISO strings
+        # and the attribute dict are built once and then updated in place
+        self._created_at_iso = created_at.isoformat()
+        self._finalized_at_iso: str | None = None
+        self._attrs_template: dict[str, Any] = {}
+        self._build_attrs_template()
+
+        self._pending_state_write = False
+
+    def _build_attrs_template(self) -> None:
+        """Rebuild the attribute dict from the lifecycle metadata."""
+        self._attrs_template = {
+            ATTR_CREATED_AT: self._created_at_iso,
             ATTR_EXPECTED_DURATION: self._expected_duration.total_seconds()
             if self._expected_duration
             else None,
-            "state": self._state,
+            ATTR_STATE: self._state,
         }
 
-        if self._finalized_at:
-            attrs[ATTR_FINALIZED_AT] = self._finalized_at.isoformat()
+        if self._finalized_at_iso:
+            self._attrs_template[ATTR_FINALIZED_AT] = self._finalized_at_iso
 
-        self._attr_extra_state_attributes = attrs
+        # HA reads the dict by reference, so later updates mutate it in place
+        self._attr_extra_state_attributes = self._attrs_template
+
+    def _update_should_persist(self) -> None:
+        """Recompute persistence after the expected duration is set."""
+        # If we don't know duration, persist to be safe
+        self._should_persist = (
+            self._expected_duration is None
+            or self._expected_duration >= self._manager.min_persist_duration
+        )
 
     @property
     def should_persist(self) -> bool:
         """Check if entity should be persisted based on duration."""
-        manager: TemporaryEntityManager = self.hass.data[DOMAIN]["manager"]
-
-        # If we don't know duration, persist to be safe
-        if self._expected_duration is None:
-            return True
-
-        return self._expected_duration >= manager.min_persist_duration
+        return self._should_persist
 
     @property
     def is_finalized(self) -> bool:
@@ -114,45 +166,80 @@ class TemporaryEntity(RestoreEntity, Entity):
         """Return if entity is active."""
         return self._state == STATE_ACTIVE
 
-    def should_cleanup(self) -> bool:
-        """Determine if entity should be cleaned up."""
-        manager: TemporaryEntityManager = self.hass.data[DOMAIN]["manager"]
-        now = dt_util.utcnow()
-
+    @property
+    def cleanup_ts(self) -> float | None:
+        """Return the Unix timestamp the entity becomes eligible for cleanup."""
         # Finalized entities: cleanup after grace period
-        if self.is_finalized and self._finalized_at:
-            age = now - self._finalized_at
-            return age >= manager.finalized_grace_period
+        if self.is_finalized and self._finalized_at_ts is not None:
+            return self._finalized_at_ts + self._manager.finalized_grace_s
 
         # Paused entities: cleanup after max age
         if self.is_paused:
-            age = now - self._created_at
-            return age >= manager.inactive_max_age
+            return self._created_at_ts + self._manager.inactive_max_age_s
 
-        return False
+        return None
 
     @callback
     def _mark_finalized(self) -> None:
         """Mark entity as finalized."""
+        if self._state == STATE_FINALIZED:
+            return
         self._set_internal_state(STATE_FINALIZED)
-        self._finalized_at = dt_util.utcnow()
-        self._update_extra_state_attributes()
-        self.async_write_ha_state()
+        finalized_at = utcnow()
+        self._finalized_at_ts = finalized_at.timestamp()
+        self._finalized_at_iso = finalized_at.isoformat()
+        self._attrs_template[ATTR_FINALIZED_AT] = self._finalized_at_iso
+        self._manager.schedule_cleanup(self, self._finalized_at_ts)
+        self._async_schedule_state_write()
 
     @callback
     def _mark_paused(self) -> None:
         """Mark entity as paused."""
+        if self._state == STATE_PAUSED:
+            return
         self._set_internal_state(STATE_PAUSED)
-        self._update_extra_state_attributes()
-        self.async_write_ha_state()
+        self._manager.schedule_cleanup(self)
+        self._async_schedule_state_write()
 
     @callback
     def _mark_active(self) -> None:
         """Mark entity as active."""
+        if self._state == STATE_ACTIVE:
+            return
         self._set_internal_state(STATE_ACTIVE)
-        self._update_extra_state_attributes()
+        self._manager.schedule_cleanup(self)
+        self._async_schedule_state_write()
+
+    @callback
+    def _async_schedule_state_write(self) -> None:
+        """Write state on the next loop iteration, coalescing repeat requests.
+
+        Compound operations (e.g. a resume that re-marks the entity active)
+        and bulk transitions then cost one state write per entity.
+        """
+        if self._pending_state_write:
+            return
+        self._pending_state_write = True
+        self.hass.loop.call_soon(self._async_flush_state_write)
+
+    @callback
+    def _async_flush_state_write(self) -> None:
+        """Write the coalesced state update, if one is still pending."""
+        if not self._pending_state_write:
+            return
+        self._pending_state_write = False
         self.async_write_ha_state()
 
+    @callback
+    def _async_fire_event(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Fire an event once any pending state write has landed.
+
+        Listeners that read the entity state in response to a lifecycle
+        event then see the transition that caused it.
+        """
+        self._async_flush_state_write()
+        self.hass.bus.async_fire(event_type, event_data)
+
     def mark_paused(self) -> None:
         """Mark entity as paused (public method)."""
         self._mark_paused()
@@ -167,11 +254,13 @@ class TemporaryEntity(RestoreEntity, Entity):
 
         # Restore previous state
         if old_state := await self.async_get_last_state():
-            self._restore_from_old_state(old_state)
+            await self._async_restore_from_old_state(old_state)
 
         # Register with manager
-        manager: TemporaryEntityManager = self.hass.data[DOMAIN]["manager"]
-        manager.register_entity(self)
+        self._manager.register_entity(self)
+
+        # Restored finalized/paused entities still need a cleanup deadline
+        self._manager.schedule_cleanup(self)
 
         # Log if entity won't persist
         if not self.should_persist:
@@ -183,36 +272,29 @@ class TemporaryEntity(RestoreEntity, Entity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
-        manager: TemporaryEntityManager = self.hass.data[DOMAIN]["manager"]
-        manager.unregister_entity(self.entity_id)
+        self._manager.unregister_entity(self.entity_id)
 
-    def _restore_from_old_state(self, old_state: State) -> None:
+    async def _async_restore_from_old_state(self, old_state: State) -> None:
         """Restore from previous state."""
+        attrs = old_state.attributes
 
         _LOGGER.info(
-            f"Restoring state for {self.entity_id}: {old_state.state} with attributes {old_state.attributes}"  # noqa: G004
+            f"Restoring state for {self.entity_id}: {old_state.state} with attributes {attrs}"  # noqa: G004
         )
 
         # Restore timestamps
-        if old_state.attributes.get("created_at"):
-            parsed_time = dt_util.parse_datetime(old_state.attributes["created_at"])
-            if parsed_time:
-                self._created_at = parsed_time
-
-        if old_state.attributes.get("finalized_at"):
-            self._finalized_at = dt_util.parse_datetime(
-                old_state.attributes["finalized_at"]
-            )
+        if (raw := attrs.get(ATTR_CREATED_AT)) and (parsed := parse_iso(raw)):
+            self._created_at_ts = parsed.timestamp()
+            self._created_at_iso = parsed.isoformat()
 
-        if old_state.attributes.get("expected_duration"):
-            self._expected_duration = timedelta(
-                seconds=old_state.attributes["expected_duration"]
-            )
+        if (raw := attrs.get(ATTR_FINALIZED_AT)) and (parsed := parse_iso(raw)):
+            self._finalized_at_ts = parsed.timestamp()
+            self._finalized_at_iso = parsed.isoformat()
+
+        if expected_duration := attrs.get(ATTR_EXPECTED_DURATION):
+            self._expected_duration = timedelta(seconds=expected_duration)
+            self._update_should_persist()
 
         # Restore state - map external states to internal states
-        state_mapping = {
-            STATE_IDLE: STATE_FINALIZED,
-            STATE_ACTIVE: STATE_ACTIVE,
-            STATE_PAUSED: STATE_PAUSED,
-        }
-        self._set_internal_state(state_mapping.get(old_state.state, STATE_ACTIVE))
+        self._set_internal_state(_RESTORE_STATE_MAP.get(old_state.state, STATE_ACTIVE))
+        self._build_attrs_template()
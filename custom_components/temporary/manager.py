@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 import logging
+import time
 from typing import TYPE_CHECKING
+import weakref
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
+
+from .const import SERVICE_METHOD_MAP
+from .timing_wheel import TimingWheel
 
 if TYPE_CHECKING:
     from .entity import TemporaryEntity
@@ -30,55 +37,117 @@ class TemporaryEntityManager:
         """Initialize manager."""
         self.hass = hass
         self.min_persist_duration = timedelta(seconds=min_persist_duration)
-        self.cleanup_interval = timedelta(seconds=cleanup_interval)
-        self.finalized_grace_period = timedelta(seconds=finalized_grace_period)
-        self.inactive_max_age = timedelta(seconds=inactive_max_age)
-
-        self._entities: dict[str, TemporaryEntity] = {}
-        self._cleanup_unsub = None
+        # Cleanup periods are only ever added to float timestamps, so they
+        # are kept as plain seconds
+        self.finalized_grace_s = float(finalized_grace_period)
+        self.inactive_max_age_s = float(inactive_max_age)
+
+        # Entities are owned by the component; weak values keep a missed
+        # unregister (e.g. a failed add) from pinning them in memory
+        self._entities: weakref.WeakValueDictionary[str, TemporaryEntity] = (
+            weakref.WeakValueDictionary()
+        )
+        self._capabilities: dict[type[TemporaryEntity], frozenset[str]] = {}
+        # One revolution of the wheel covers a cleanup interval at 1s
+        # resolution; later deadlines wait in its overflow heap.
+        self._wheel = TimingWheel(cleanup_interval)
+        self._tick_unsub: CALLBACK_TYPE | None = None
+        self._tick_at: float | None = None
+        self._started = False
 
     @callback
     def register_entity(self, entity: TemporaryEntity) -> None:
         """Register a temporary entity."""
         self._entities[entity.entity_id] = entity
+
+        entity_type = type(entity)
+        if entity_type not in self._capabilities:
+            self._capabilities[entity_type] = frozenset(
+                service
+                for service, method in SERVICE_METHOD_MAP.items()
+                if hasattr(entity_type, method)
+            )
         _LOGGER.debug("Registered temporary entity: %s", entity.entity_id)
 
     @callback
     def unregister_entity(self, entity_id: str):
         """Unregister a temporary entity."""
         self._entities.pop(entity_id, None)
+        self._wheel.cancel(entity_id)
         _LOGGER.debug("Unregistered temporary entity: %s", entity_id)
 
+    @callback
+    def schedule_cleanup(
+        self, entity: TemporaryEntity, now_ts: float | None = None
+    ) -> None:
+        """Schedule cleanup of an entity at its expiry, or cancel it.
+
+        Args:
+            entity: The entity to (re)schedule.
+            now_ts: Current Unix time, if the caller already read the clock.
+        """
+        # Only paused and finalized entities have a deadline, so the wheel
+        # doubles as the index of cleanup candidates; active ones drop out
+        if (cleanup_ts := entity.cleanup_ts) is None:
+            self._wheel.cancel(entity.entity_id)
+            return
+
+        if now_ts is None:
+            now_ts = time.time()
+        deadline = self._wheel.schedule(entity.entity_id, cleanup_ts, now_ts)
+        # Only an earlier deadline moves the wakeup; cancelled or later ones
+        # are picked up when the armed tick fires
+        if self._tick_at is None or deadline < self._tick_at:
+            self._async_arm_tick(deadline, now_ts)
+
     async def async_start(self):
         """Start the cleanup task."""
-        self._cleanup_unsub = async_track_time_interval(
-            self.hass,
-            self._async_cleanup_task,
-            self.cleanup_interval,
-        )
+        self._started = True
+        self._async_arm_tick(self._wheel.next_deadline())
         _LOGGER.info("Temporary entity cleanup task started")
 
     async def async_stop(self):
         """Stop the cleanup task."""
-        if self._cleanup_unsub:
-            self._cleanup_unsub()
-            self._cleanup_unsub = None
+        self._started = False
+        self._async_arm_tick(None)
         _LOGGER.info("Temporary entity cleanup task stopped")
 
-    async def _async_cleanup_task(self, now: datetime) -> None:
-        """Periodic cleanup task."""
-        to_remove: list[str] = []
+    @callback
+    def _async_arm_tick(
+        self, deadline: float | None, now_ts: float | None = None
+    ) -> None:
+        """Arm a single wakeup at ``deadline``, replacing any armed one."""
+        if self._tick_unsub:
+            self._tick_unsub()
+            self._tick_unsub = None
+        self._tick_at = None
+
+        if not self._started or deadline is None:
+            return
 
-        for entity_id, entity in self._entities.items():
-            if entity.should_cleanup():
-                to_remove.append(entity_id)
+        self._tick_at = deadline
+        if now_ts is None:
+            now_ts = time.time()
+        delay = max(deadline - now_ts, 0)
+        self._tick_unsub = async_call_later(self.hass, delay, self._async_cleanup_task)
 
-        for entity_id in to_remove:
-            await self.async_remove_entity(entity_id)
+    async def _async_cleanup_task(self, now: datetime) -> None:
+        """Remove entities whose wheel bucket has come due."""
+        # The loop clock can fire a hair before the wall clock reaches the
+        # armed tick; treat that tick as reached so it is not re-armed at 0s
+        now_ts = max(now.timestamp(), self._tick_at or 0.0)
+        self._tick_unsub = None
+        self._tick_at = None
+        to_remove = self._wheel.advance(now_ts)
 
         if to_remove:
+            await self.async_remove_entities(to_remove)
             _LOGGER.info("Cleaned up %d temporary entities", len(to_remove))
 
+        # Removals can reschedule other entities while awaiting, so re-arm
+        # from the wheel itself rather than trusting any tick armed meanwhile
+        self._async_arm_tick(self._wheel.next_deadline())
+
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove a temporary entity."""
         entity = self._entities.get(entity_id)
@@ -96,10 +165,37 @@ class TemporaryEntityManager:
 
         _LOGGER.debug("Removed temporary entity: %s", entity_id)
 
+    async def async_remove_entities(self, entity_ids: Iterable[str]) -> None:
+        """Remove several temporary entities concurrently.
+
+        A failed removal is logged and does not stop the others. A cancelled
+        removal is logged too, then re-raised once every result is logged.
+        """
+        entity_ids = list(entity_ids)
+        results = await asyncio.gather(
+            *(self.async_remove_entity(entity_id) for entity_id in entity_ids),
+            return_exceptions=True,
+        )
+        reraise: BaseException | None = None
+        for entity_id, result in zip(entity_ids, results, strict=True):
+            if not isinstance(result, BaseException):
+                continue
+            _LOGGER.error("Error removing entity %s: %r", entity_id, result)
+            if not isinstance(result, Exception) and reraise is None:
+                # CancelledError and other non-Exception results propagate
+                reraise = result
+        if reraise is not None:
+            raise reraise
+
     def get_entity(self, entity_id: str) -> TemporaryEntity | None:
         """Get an entity by ID."""
         return self._entities.get(entity_id)
 
+    def supports(self, entity: TemporaryEntity, service: str) -> bool:
+        """Return if an entity supports an action service."""
+        capabilities = self._capabilities.get(type(entity), frozenset())
+        return service in capabilities
+
     def get_all_entities(self) -> list[TemporaryEntity]:
         """Get all registered entities."""
         return list(self._entities.values())
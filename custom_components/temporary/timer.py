@@ -1,15 +1,17 @@
-"""Temporary timer platform."""
+"""Temporary timer entity."""
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 import logging
+import re
+import time
 from typing import Any
 
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.helpers.event import async_track_point_in_time
-import homeassistant.util.dt as dt_util
 
 from .const import (
     ATTR_DURATION,
@@ -19,6 +21,7 @@ from .const import (
     STATE_IDLE,
     STATE_PAUSED,
 )
+from .dt import parse_iso, utcnow
 from .entity import TemporaryEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,32 +33,42 @@ EVENT_TIMER_CHANGED = "temporary.timer_changed"
 EVENT_TIMER_PAUSED = "temporary.timer_paused"
 EVENT_TIMER_RESUMED = "temporary.timer_resumed"
 
+# call_at may fire up to one clock tick early
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
 
-def _format_timedelta(delta: timedelta) -> str:
-    """Format timedelta as H:MM:SS string."""
-    total_seconds = max(delta.total_seconds(), 0)
-    hours, remainder = divmod(total_seconds, 3600)
+_HMS_RE = re.compile(r"(\d+):(\d{1,2}):(\d{1,2})")
+
+
+def _format_seconds(total_seconds: int) -> str:
+    """Format whole seconds as H:MM:SS string."""
+    hours, remainder = divmod(max(total_seconds, 0), 3600)
     minutes, seconds = divmod(remainder, 60)
-    return f"{int(hours)}:{int(minutes):02}:{int(seconds):02}"
+    return f"{hours}:{minutes:02}:{seconds:02}"
 
 
 def _parse_timedelta(time_str: str) -> int:
-    """Parse H:MM:SS string to seconds."""
-    try:
-        parts = time_str.split(":")
-        if len(parts) != 3:
-            return 0
-        hours, minutes, seconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-    except ValueError:
-        return 0
-    except AttributeError:
+    """Parse H:MM:SS string to seconds, or 0 if malformed."""
+    if not isinstance(time_str, str) or not (match := _HMS_RE.fullmatch(time_str)):
         return 0
+    return int(match[1]) * 3600 + int(match[2]) * 60 + int(match[3])
 
 
 class TemporaryTimer(TemporaryEntity):
     """Temporary timer entity."""
 
+    # Timer-owned fields only; see TemporaryEntity for why _attr_* stay out
+    __slots__ = (
+        "_duration_s",
+        "_duration_str",
+        "_end_time_iso",
+        "_end_time_ts",
+        "_event_base",
+        "_finish_deadline",
+        "_finish_handle",
+        "_is_restoring",
+        "_remaining_s",
+    )
+
     _attr_icon = "mdi:timer"
 
     def __init__(
@@ -76,135 +89,153 @@ class TemporaryTimer(TemporaryEntity):
         )
 
         self._duration_s: int = duration
-        self._remaining: timedelta | None = None
-        self._start_time: datetime | None = None
-        self._end_time: datetime | None = None
-        self._finish_unsub = None
+        self._remaining_s: float | None = None
+        self._end_time_ts: float | None = None
+        # One-shot finish on the loop's monotonic clock; the wall-clock end
+        # timestamp above is only kept for attributes, events and restore
+        self._finish_handle: asyncio.TimerHandle | None = None
+        self._finish_deadline: float | None = None
         self._is_restoring: bool = False
         self._set_internal_state(STATE_IDLE)
 
-    def set_duration(self, duration: int) -> None:
-        """Set the duration."""
+        # Duration and end time only change on set/start/restore, so their
+        # formatted values are cached in the attribute template
+        self._duration_str = _format_seconds(duration)
+        self._end_time_iso: str | None = None
+        self._sync_timer_attrs()
+
+        # Identity fields shared by every event; copied rather than rebuilt
+        self._event_base: dict[str, Any] = {
+            ATTR_ENTITY_ID: self.entity_id,
+            "name": name,
+        }
+
+    def _sync_timer_attrs(self) -> None:
+        """Write the cached timer attributes into the attribute template."""
+        self._attrs_template[ATTR_DURATION] = self._duration_str
+        if self._end_time_iso:
+            self._attrs_template[ATTR_FINISHES_AT] = self._end_time_iso
+
+    def _set_end_time(self, end_time: datetime) -> None:
+        """Set the cached end timestamp and ISO string."""
+        self._end_time_ts = end_time.timestamp()
+        self._end_time_iso = end_time.isoformat()
+        self._attrs_template[ATTR_FINISHES_AT] = self._end_time_iso
+
+    def set_duration(self, duration: int | None) -> None:
+        """Set the duration; None keeps the current one."""
         old_duration = self._duration_s
+        if duration is None or duration == old_duration:
+            # Nothing changed: no event and no state write
+            return
+
         self._duration_s = duration
+        self._duration_str = _format_seconds(duration)
+        self._attrs_template[ATTR_DURATION] = self._duration_str
+
+        # Queued before the changed event, which flushes it so listeners see
+        # the new duration
+        self._async_schedule_state_write()
 
         # Fire changed event
         if not self._is_restoring:
             event_data = self._build_event_data()
             event_data["old_duration"] = old_duration
             event_data[ATTR_DURATION] = duration
-            self.hass.bus.async_fire(EVENT_TIMER_CHANGED, event_data)
-
-        self.async_write_ha_state()
-
-    def _update_extra_state_attributes(self) -> None:
-        """Update extra state attributes."""
-        # Call parent to set base attributes
-        super()._update_extra_state_attributes()
-
-        # Add timer-specific attributes
-        self._attr_extra_state_attributes = self._attr_extra_state_attributes or {}
-
-        # Calculate remaining time based on state
-        if self.is_active and self._end_time:
-            # Active: calculate from end time
-            now = dt_util.utcnow()
-            remaining = self._end_time - now
-            if remaining.total_seconds() < 0:
-                remaining = timedelta(0)
-        elif self.is_paused and self._remaining is not None:
+            self._async_fire_event(EVENT_TIMER_CHANGED, event_data)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return state attributes, computing remaining time on read.
+
+        Duration and finishes_at are kept current in the template as they
+        change; only the remaining time depends on when state is read, so
+        it is filled in here when HA serializes the state.
+        """
+        # Calculate remaining seconds based on state (negatives format as 0)
+        if self.is_active and self._finish_deadline is not None:
+            # Active: calculate from the loop-clock deadline
+            remaining_s = int(self._finish_deadline - self.hass.loop.time())
+        elif self.is_paused and self._remaining_s is not None:
             # Paused: use stored remaining time
-            remaining = self._remaining
+            remaining_s = int(self._remaining_s)
         else:
             # Idle/finalized or no remaining data: show zero
-            remaining = timedelta(0)
+            remaining_s = 0
 
-        # Format duration as timedelta for formatting
-        duration_delta = timedelta(seconds=self._duration_s)
-
-        self._attr_extra_state_attributes.update(
-            {
-                ATTR_DURATION: _format_timedelta(duration_delta),
-                ATTR_REMAINING: _format_timedelta(remaining),
-            }
-        )
-
-        if self._end_time:
-            self._attr_extra_state_attributes[ATTR_FINISHES_AT] = (
-                self._end_time.isoformat()
-            )
+        self._attrs_template[ATTR_REMAINING] = _format_seconds(remaining_s)
+        return self._attrs_template
 
     def _build_event_data(self) -> dict[str, Any]:
         """Build common event data for timer events."""
-        event_data: dict[str, Any] = {
-            ATTR_ENTITY_ID: self.entity_id,
-            "name": self._attr_name,
-            ATTR_DURATION: self._duration_s,
-            ATTR_FINISHES_AT: self._end_time.isoformat() if self._end_time else None,
-        }
+        event_data = self._event_base.copy()
+        event_data[ATTR_DURATION] = self._duration_s
+        event_data[ATTR_FINISHES_AT] = self._end_time_iso
         return event_data
 
-    async def start(self, is_resume: bool = False) -> None:
+    @callback
+    def start(self, is_resume: bool = False) -> None:
         """Start the timer.
 
         Args:
             is_resume: True if starting from a resume operation, False otherwise.
         """
-        # Cancel existing timer if running
-        self._cancel_timers()
-
         # Determine duration: use remaining if resuming from pause, otherwise use full duration
-        duration = (
-            self._remaining
-            if self._remaining is not None
-            else timedelta(seconds=self._duration_s)
+        duration_s = (
+            self._remaining_s if self._remaining_s is not None else self._duration_s
         )
 
-        # Set start and end times
-        self._start_time = dt_util.utcnow()
-        self._end_time = self._start_time + duration
+        # Set end time
+        self._set_end_time(utcnow() + timedelta(seconds=duration_s))
 
-        # Clear remaining since we're now tracking via end_time
-        self._remaining = None
+        # Clear remaining since we're now tracking via the deadline
+        self._remaining_s = None
 
-        # Mark as active
+        # Mark as active; a restart of an already active timer is a no-op
+        # transition but still changes finishes_at, so write state either way
         self._mark_active()
-
-        # Schedule finish at end_time (convert to Python datetime)
-        self._finish_unsub = async_track_point_in_time(
-            self.hass, self._async_finish_callback, self._end_time
-        )
+        self._async_schedule_state_write()
+
+        # Schedule finish on the loop clock. A still-armed handle that fires
+        # no later than the new deadline is kept and re-arms itself when it
+        # fires, so pause/resume and restarts avoid cancel-and-push churn.
+        loop = self.hass.loop
+        self._finish_deadline = loop.time() + duration_s
+        handle = self._finish_handle
+        if handle is None or handle.when() > self._finish_deadline:
+            if handle is not None:
+                handle.cancel()
+            self._finish_handle = loop.call_at(
+                self._finish_deadline, self._async_finish_callback
+            )
 
         _LOGGER.debug(
             "Started timer %s for %s seconds",
             self.entity_id,
-            duration.total_seconds(),
+            duration_s,
         )
 
         # Fire created event (only if not resuming and not restoring)
         if not is_resume and not self._is_restoring:
             event_data = self._build_event_data()
-            self.hass.bus.async_fire(EVENT_TIMER_CREATED, event_data)
+            self._async_fire_event(EVENT_TIMER_CREATED, event_data)
 
+    @callback
     def async_pause(self) -> None:
         """Pause the timer."""
         if not self.is_active:
             return
 
-        # Cancel timer callbacks
-        self._cancel_timers()
-
         # Calculate remaining time with 2 decimal precision
-        if self._end_time:
-            now = dt_util.utcnow()
-            remaining_delta = self._end_time - now
-            if remaining_delta.total_seconds() < 0:
-                self._remaining = timedelta(0)
-            else:
-                # Round to 2 decimal places
-                self._remaining = timedelta(
-                    seconds=round(remaining_delta.total_seconds(), 2)
-                )
+        if self._finish_deadline is not None:
+            remaining_s = self._finish_deadline - self.hass.loop.time()
+            # Round to 2 decimal places
+            self._remaining_s = max(round(remaining_s, 2), 0.0)
+
+        # Leave the finish handle armed for a quick resume; it is a no-op if
+        # it fires while the timer is paused. It holds a reference to the
+        # entity until the original deadline, or until removal cancels it.
+        self._finish_deadline = None
 
         # Mark as paused
         self._mark_paused()
@@ -212,28 +243,30 @@ class TemporaryTimer(TemporaryEntity):
         _LOGGER.debug(
             "Paused timer %s with %s seconds remaining",
             self.entity_id,
-            self._remaining.total_seconds() if self._remaining else 0,
+            self._remaining_s or 0,
         )
 
         # Fire paused event
         if not self._is_restoring:
             event_data = self._build_event_data()
-            if self._remaining:
-                event_data[ATTR_REMAINING] = self._remaining.total_seconds()
-            self.hass.bus.async_fire(EVENT_TIMER_PAUSED, event_data)
+            if self._remaining_s:
+                event_data[ATTR_REMAINING] = self._remaining_s
+            self._async_fire_event(EVENT_TIMER_PAUSED, event_data)
 
-    async def async_resume(self) -> None:
+    @callback
+    def async_resume(self) -> None:
         """Resume the timer."""
         if not self.is_paused:
             return
 
-        await self.start(is_resume=True)
+        self.start(is_resume=True)
 
         # Fire resumed event before starting
         if not self._is_restoring:
             event_data = self._build_event_data()
-            self.hass.bus.async_fire(EVENT_TIMER_RESUMED, event_data)
+            self._async_fire_event(EVENT_TIMER_RESUMED, event_data)
 
+    @callback
     def async_cancel(self) -> None:
         """Cancel the timer."""
         self._cancel_timers()
@@ -244,8 +277,9 @@ class TemporaryTimer(TemporaryEntity):
         if not self._is_restoring:
             event_data = self._build_event_data()
             # Include remaining time if timer was active or paused
-            self.hass.bus.async_fire(EVENT_TIMER_CANCELLED, event_data)
+            self._async_fire_event(EVENT_TIMER_CANCELLED, event_data)
 
+    @callback
     def async_finish(self) -> None:
         """Finish the timer."""
         self._cancel_timers()
@@ -255,22 +289,35 @@ class TemporaryTimer(TemporaryEntity):
         # Fire event for automations
         if not self._is_restoring:
             event_data = self._build_event_data()
-            self.hass.bus.async_fire(EVENT_TIMER_FINISHED, event_data)
+            self._async_fire_event(EVENT_TIMER_FINISHED, event_data)
 
     @callback
-    def _async_finish_callback(self, now: Any) -> None:
+    def _async_finish_callback(self) -> None:
         """Callback when timer finishes."""
+        self._finish_handle = None
+        deadline = self._finish_deadline
+        if deadline is None or not self.is_active:
+            # Paused since the handle was armed
+            return
+
+        loop = self.hass.loop
+        if loop.time() + _CLOCK_RESOLUTION < deadline:
+            # Deadline moved later after this handle was armed
+            self._finish_handle = loop.call_at(deadline, self._async_finish_callback)
+            return
+
         self.async_finish()
 
     def _cancel_timers(self) -> None:
         """Cancel all timer callbacks."""
-        if self._finish_unsub:
-            self._finish_unsub()
-            self._finish_unsub = None
+        if self._finish_handle:
+            self._finish_handle.cancel()
+            self._finish_handle = None
+        self._finish_deadline = None
 
-    def _restore_from_old_state(self, old_state: State) -> None:
+    async def _async_restore_from_old_state(self, old_state: State) -> None:
         """Restore from previous state."""
-        super()._restore_from_old_state(old_state)
+        await super()._async_restore_from_old_state(old_state)
 
         # Set restoration flag to suppress events
         self._is_restoring = True
@@ -283,45 +330,56 @@ class TemporaryTimer(TemporaryEntity):
                 self._duration_s = _parse_timedelta(duration_val)
             else:
                 self._duration_s = int(duration_val)
+            self._duration_str = _format_seconds(self._duration_s)
 
-        if old_state.attributes.get("start_time"):
-            start_dt = dt_util.parse_datetime(old_state.attributes["start_time"])
-            if start_dt:
-                self._start_time = start_dt
+        if raw_end := old_state.attributes.get(ATTR_FINISHES_AT):
+            if old_state.state == STATE_ACTIVE:
+                # Only an active timer needs the end time to derive remaining
+                if end_dt := parse_iso(raw_end):
+                    self._set_end_time(end_dt)
+            else:
+                # Otherwise it is only shown again, so keep the string as is
+                self._end_time_iso = raw_end
 
-        if old_state.attributes.get(ATTR_FINISHES_AT):
-            end_dt = dt_util.parse_datetime(old_state.attributes[ATTR_FINISHES_AT])
-            if end_dt:
-                self._end_time = end_dt
+        # The base restore rebuilt the template, so re-apply timer attributes
+        self._sync_timer_attrs()
 
         # Restore based on saved state
-        if old_state.state == STATE_ACTIVE and self._end_time:
+        if old_state.state == STATE_ACTIVE and self._end_time_ts is not None:
             # For active timers, derive remaining from finishes_at
-            now = dt_util.utcnow()
-            remaining = self._end_time - now
-            if remaining.total_seconds() > 0:
-                self._remaining = remaining
-                self.hass.async_create_task(self.start())
+            remaining_s = self._end_time_ts - time.time()
+            if remaining_s > 0:
+                self._remaining_s = remaining_s
+                # Started inline so the timer is running (and its created
+                # event suppressed) before async_added_to_hass returns
+                self.start()
             else:
                 # Timer expired during downtime — finish immediately
                 self.async_finish()
         elif old_state.state == STATE_PAUSED:
-            # Only set _remaining from saved attribute for paused timers
+            # Only set _remaining_s from saved attribute for paused timers
             if old_state.attributes.get(ATTR_REMAINING):
                 remaining_val = old_state.attributes[ATTR_REMAINING]
                 if isinstance(remaining_val, str):
-                    remaining_seconds = _parse_timedelta(remaining_val)
+                    self._remaining_s = float(_parse_timedelta(remaining_val))
                 else:
-                    remaining_seconds = float(remaining_val)
-                self._remaining = timedelta(seconds=remaining_seconds)
-            self.async_write_ha_state()
-        else:
-            self.async_write_ha_state()
+                    self._remaining_s = float(remaining_val)
+
+        # No explicit write here: HA writes state once async_added_to_hass
+        # returns, which covers every restored branch
 
         # Clear restoration flag
         self._is_restoring = False
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity is added to hass."""
+        # The entity registry may have assigned a different entity_id
+        self._event_base[ATTR_ENTITY_ID] = self.entity_id
+        await super().async_added_to_hass()
+
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
+        # Also cancels a handle left armed by pause, so a deleted timer is
+        # not kept alive by the loop until its original deadline
         self._cancel_timers()
         await super().async_will_remove_from_hass()
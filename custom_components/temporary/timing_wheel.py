@@ -0,0 +1,152 @@
+"""Timing wheel used to schedule temporary entity cleanup."""
+
+from __future__ import annotations
+
+from collections import deque
+import heapq
+import math
+
+# Overflow entries allowed per live key before stale ones are compacted away
+_OVERFLOW_COMPACT_FACTOR = 2
+
+
+class TimingWheel:
+    """Single-level timing wheel with an overflow heap.
+
+    Deadlines that fall within ``span`` ticks of the cursor live in
+    per-tick buckets; anything further out waits in an overflow min-heap
+    whose head is cascaded into the wheel once per revolution, so long
+    deadlines are never rescanned. Cancellation is lazy:
+    ``_handles`` records the current deadline of each key, and bucket
+    entries whose deadline no longer matches are dropped when popped.
+    """
+
+    def __init__(self, span: int, resolution: float = 1.0) -> None:
+        """Initialize the wheel with ``span`` buckets of ``resolution`` seconds."""
+        self._span = max(span, 1)
+        self._resolution = resolution
+        self._buckets: deque[list[str]] = deque([] for _ in range(self._span))
+        self._overflow: list[tuple[int, str]] = []
+        self._handles: dict[str, int] = {}
+        self._cursor = 0
+        self._next_cascade = 0
+
+    def schedule(self, key: str, when: float, now: float) -> float:
+        """Schedule ``key`` to expire at timestamp ``when``.
+
+        Replaces any previous deadline for the same key and returns the
+        timestamp of the tick it will expire on.
+        """
+        if not self._handles:
+            self._reset(math.floor(now / self._resolution))
+
+        deadline = max(math.ceil(when / self._resolution), self._cursor)
+        if self._handles.get(key) == deadline:
+            # Already queued for this tick; a second entry would only be stale
+            return deadline * self._resolution
+        self._handles[key] = deadline
+
+        offset = deadline - self._cursor
+        if offset < self._span:
+            self._buckets[offset].append(key)
+        else:
+            heapq.heappush(self._overflow, (deadline, key))
+            if len(self._overflow) > _OVERFLOW_COMPACT_FACTOR * len(self._handles):
+                self._compact()
+        return deadline * self._resolution
+
+    def cancel(self, key: str) -> None:
+        """Cancel the deadline for ``key``, if any."""
+        self._handles.pop(key, None)
+
+    def next_deadline(self) -> float | None:
+        """Return the timestamp of the earliest pending deadline, if any."""
+        handles = self._handles
+        if not handles:
+            return None
+
+        earliest: int | None = None
+        for offset, bucket in enumerate(self._buckets):
+            tick = self._cursor + offset
+            if any(handles.get(key) == tick for key in bucket):
+                earliest = tick
+                break
+
+        # Overflow entries are only cascaded once per revolution, so the
+        # heap head can still precede the first live bucket
+        overflow = self._overflow
+        while overflow and handles.get(overflow[0][1]) != overflow[0][0]:
+            heapq.heappop(overflow)
+        if overflow and (earliest is None or overflow[0][0] < earliest):
+            earliest = overflow[0][0]
+
+        return None if earliest is None else earliest * self._resolution
+
+    def advance(self, now: float) -> list[str]:
+        """Advance the wheel to timestamp ``now`` and return expired keys."""
+        target = math.floor(now / self._resolution)
+        expired: list[str] = []
+
+        # Slept through a whole revolution: every bucket is due, so collect
+        # them all and jump straight to the target tick.
+        if target - self._cursor >= self._span:
+            for offset, bucket in enumerate(self._buckets):
+                self._collect(bucket, self._cursor + offset, expired)
+            self._cursor = target
+            self._next_cascade = target
+
+        while self._cursor <= target and self._handles:
+            if self._cursor >= self._next_cascade:
+                self._cascade()
+            self._collect(self._buckets[0], self._cursor, expired)
+            self._buckets.rotate(-1)
+            self._cursor += 1
+
+        return expired
+
+    def _collect(self, bucket: list[str], tick: int, expired: list[str]) -> None:
+        """Move live keys due at ``tick`` from ``bucket`` into ``expired``."""
+        handles = self._handles
+        for key in bucket:
+            if handles.get(key) == tick:
+                del handles[key]
+                expired.append(key)
+        bucket.clear()
+
+    def _cascade(self) -> None:
+        """Move overflow entries that now fit into the wheel."""
+        overflow = self._overflow
+        horizon = self._cursor + self._span
+        while overflow and overflow[0][0] < horizon:
+            deadline, key = heapq.heappop(overflow)
+            if self._handles.get(key) != deadline:
+                continue
+            offset = deadline - self._cursor
+            if offset < 0:
+                # Overdue after a fast-forward: expire on the current tick
+                self._handles[key] = self._cursor
+                self._buckets[0].append(key)
+            else:
+                self._buckets[offset].append(key)
+        self._next_cascade = horizon
+
+    def _compact(self) -> None:
+        """Drop stale overflow entries left by cancels and reschedules.
+
+        Otherwise a key rescheduled past the horizon many times in one
+        revolution (e.g. a timer paused and resumed repeatedly) grows the
+        heap until the next cascade.
+        """
+        handles = self._handles
+        self._overflow = list(
+            {entry for entry in self._overflow if handles.get(entry[1]) == entry[0]}
+        )
+        heapq.heapify(self._overflow)
+
+    def _reset(self, tick: int) -> None:
+        """Re-anchor an empty wheel at ``tick``, dropping stale entries."""
+        for bucket in self._buckets:
+            bucket.clear()
+        self._overflow.clear()
+        self._cursor = tick
+        self._next_cascade = tick + self._span